@@ -15,17 +15,54 @@ class User(serializers.Serializer):
         owner_fields = ('email',)
         optional_fields = ('profile',)
         write_only_fields = ('password',)
+
+Setting `cache_fields = True` on Meta builds the parent serializer's fields
+only once per class, rather than once per serializer. Only do so when those
+fields do not depend on the context.
 """
 import copy
+import weakref
+from collections import OrderedDict
 from rest_framework.fields import get_attribute
 
 
 OWNER_FIELDS_NO_ATTR = 'May not set `owner_fields` without `owner_attr.`'
 
+# Base fields for serializer classes with `Meta.cache_fields` set, as returned
+# by the parent `get_fields`.
+_FIELDS_CACHE = weakref.WeakKeyDictionary()
+
 
 class OptionalFieldsMixin(object):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # These only depend on the class' Meta, so work them out up front.
+        meta = getattr(cls, 'Meta', None)
+        owner_attr = getattr(meta, 'owner_attr', None)
+        cls._owner_attr_star = owner_attr == '*'
+        cls._owner_attr_path = tuple(owner_attr.split('.')) \
+            if owner_attr and owner_attr != '*' else None
+        cls._owner_field_names = frozenset(getattr(meta, 'owner_fields', ()))
+        cls._cache_fields = bool(getattr(meta, 'cache_fields', False))
+
+        # The inlined filter in `get_fields` can only be used if neither
+        # `allow_field` nor `show_field` is overridden.
+        cls._default_field_filters = \
+            cls.allow_field is OptionalFieldsMixin.allow_field and \
+            cls.show_field is OptionalFieldsMixin.show_field
+
+        # Query param names can only be precomputed if they use the default
+        # format; otherwise `get_show_field_param` is asked on each call.
+        default_param = cls.get_show_field_param is OptionalFieldsMixin.get_show_field_param
+        cls._show_field_params = {
+            name: ('show_%s_field' % name if default_param else None,
+                   'show_%s' % name)
+            for name in getattr(meta, 'optional_fields', ())
+        }
+
     def __init__(self, *args, **kwargs):
-        super(OptionalFieldsMixin, self).__init__(*args, **kwargs)
+        super().__init__(*args, **kwargs)
 
         meta = getattr(self, 'Meta', None)
         has_owner_fields = hasattr(meta, 'owner_fields')
@@ -33,27 +70,87 @@ class OptionalFieldsMixin(object):
 
         assert has_owner_attr or not has_owner_fields, OWNER_FIELDS_NO_ATTR
 
+    @classmethod
+    def clear_fields_cache(cls):
+        """
+        Forgets the cached base fields, e.g. after altering the class' fields.
+        """
+        _FIELDS_CACHE.pop(cls, None)
+
+    def _get_base_fields(self):
+        """
+        Returns the fields built by the parent serializer.
+
+        With `Meta.cache_fields` set, they are only built once per class and
+        are shared by every instance of the class, so must be copied before
+        being used.
+        """
+        if not self._cache_fields:
+            return super().get_fields()
+
+        cls = type(self)
+        fields = _FIELDS_CACHE.get(cls)
+        if fields is None:
+            fields = _FIELDS_CACHE[cls] = super().get_fields()
+        return fields
+
     def get_fields(self):
-        fields = super(OptionalFieldsMixin, self).get_fields()
+        fields = self._get_base_fields()
+        cache_fields = self._cache_fields
 
-        for name, field in fields.copy().items():
-            if self.allow_field(name, field) and self.show_field(name, field):
+        if not self._default_field_filters:
+            allow_field = self.allow_field
+            show_field = self.show_field
+        else:
+            owner_fields = self._owner_field_names
+            optional_fields = self._show_field_params
+
+            # Most serializers have neither; skip filtering altogether.
+            if not owner_fields and not optional_fields:
+                if not cache_fields:
+                    return fields
+                return OrderedDict(
+                    (name, copy.deepcopy(field)) for name, field in fields.items()
+                )
+
+            request = self.context.get('request', None)
+            instance = self.instance
+
+            # Ownership does not depend on the field, so only check it once.
+            is_owner = False
+            if any(name in fields for name in owner_fields):
+                is_owner = self._is_owner(request, instance)
+
+            def allow_field(name, field):
+                return is_owner or name not in owner_fields
+
+            def show_field(name, field):
+                return not instance or name not in optional_fields or \
+                    self._show_optional_field(name, field, request, instance)
+
+        kept = OrderedDict()
+        for name, field in fields.items():
+            if not allow_field(name, field):
                 continue
-            fields.pop(name)
 
-        return fields
+            # Cached fields are shared by the whole class, so copy them before
+            # they are handed to any `show_<field>` function.
+            if cache_fields:
+                field = copy.deepcopy(field)
 
-    def get_owner_of(self, obj):
-        try:
-            meta = getattr(self, 'Meta', None)
-            owner_attr = getattr(meta, 'owner_attr')
-        except KeyError:
-            return None
+            if show_field(name, field):
+                kept[name] = field
+
+        return kept
 
-        if owner_attr == '*':
+    def get_owner_of(self, obj):
+        if self._owner_attr_star:
             return obj
 
-        return get_attribute(obj, owner_attr.split('.'))
+        if self._owner_attr_path is None:
+            return None
+
+        return get_attribute(obj, self._owner_attr_path)
 
     def user_is_owner(self, user, obj):
         if user.is_superuser:
@@ -65,19 +162,16 @@ class OptionalFieldsMixin(object):
         return False
 
     def allow_field(self, field_name, field):
-        meta = getattr(self, 'Meta', None)
-        request = self.context.get('request', None)
-
         # Do not hide fields that are not owner.
-        if field_name not in getattr(meta, 'owner_fields', ()):
+        if field_name not in self._owner_field_names:
             return True
 
-        if not hasattr(meta, 'owner_fields'):
-            return True
-        else:
-            if not request:
-                return False
-            return self.user_is_owner(request.user, self.instance)
+        return self._is_owner(self.context.get('request', None), self.instance)
+
+    def _is_owner(self, request, instance):
+        if not request:
+            return False
+        return self.user_is_owner(request.user, instance)
 
     def get_show_field_param(self, field_name):
         return 'show_%s_field' % field_name
@@ -86,7 +180,6 @@ class OptionalFieldsMixin(object):
         """
         Determines whether or not a field should be shown.
         """
-        show_func_name = 'show_%s' % field_name
         request = self.context.get('request', None)
 
         # Do not hide fields in write cases.
@@ -94,21 +187,27 @@ class OptionalFieldsMixin(object):
             return True
 
         # Do not hide fields that are not optional.
-        if field_name not in getattr(self.Meta, 'optional_fields', ()):
+        if field_name not in self._show_field_params:
             return True
 
+        return self._show_optional_field(field_name, field, request, self.instance)
+
+    def _show_optional_field(self, field_name, field, request, instance):
+        field_param, show_func_name = self._show_field_params[field_name]
+        if field_param is None:
+            field_param = self.get_show_field_param(field_name)
+
         # Run a function named show_{field} if one exists.
         if hasattr(self, show_func_name):
             show_func = getattr(self, show_func_name)
             if callable(show_func):
-                result = show_func(instance=self.instance, field_name=field_name,
+                result = show_func(instance=instance, field_name=field_name,
                                    field=field)
                 if result is not None:
                     return result
 
         # Do not hide optional fields if they are explicitly requested.
         if request is not None:
-            field_param = self.get_show_field_param(field_name)
             if field_param in request.query_params:
                 return request.query_params[field_param].lower() in ['1', 'y', 'true']
 
@@ -1,18 +1,16 @@
-import six
 from rest_framework.exceptions import ValidationError
-from rest_framework.fields import get_attribute, empty
+from rest_framework.fields import empty
 from rest_framework.serializers import BaseSerializer
 
 
 class PolymorphicSerializerMetaclass(type):
     @classmethod
     def _get_type_fields(cls, bases, attrs):
-        fields = {}
-        if 'Types' in attrs:
-            for name, data in attrs['Types'].__dict__.items():
-                if name.startswith('_'):
-                    continue
-                fields[name] = data
+        fields = {
+            name: data
+            for name, data in vars(attrs['Types']).items()
+            if not name.startswith('_')
+        } if 'Types' in attrs else {}
 
         for base in reversed(bases):
             if hasattr(base, '_type_fields'):
@@ -23,30 +21,32 @@ class PolymorphicSerializerMetaclass(type):
         return fields
 
     @classmethod
-    def _get_declared_types(cls, bases, attrs):
-        return {
-            name: (cls, serializer)
-            for name, (cls, serializer)
-            in attrs['_type_fields'].items()
-        }
+    def _get_type_maps(cls, attrs):
+        """
+        Builds every lookup of the declared types in a single pass.
+        """
+        declared_types = {}
+        declared_classes = {}
+        type_names = {}
+
+        for name, (type_cls, serializer) in attrs['_type_fields'].items():
+            declared_types[name] = (type_cls, serializer)
+            declared_classes[type_cls] = (name, serializer)
+            type_names[type_cls] = name
 
-    @classmethod
-    def _get_declared_classes(cls, bases, attrs):
         return {
-            cls: (name, serializer)
-            for name, (cls, serializer)
-            in attrs['_type_fields'].items()
+            '_declared_types': declared_types,
+            '_declared_classes': declared_classes,
+            '_type_name_for_class': type_names,
         }
 
     def __new__(cls, name, bases, attrs):
         attrs['_type_fields'] = cls._get_type_fields(bases, attrs)
-        attrs['_declared_types'] = cls._get_declared_types(bases, attrs)
-        attrs['_declared_classes'] = cls._get_declared_classes(bases, attrs)
-        return super(PolymorphicSerializerMetaclass, cls).__new__(cls, name, bases, attrs)
+        attrs.update(cls._get_type_maps(attrs))
+        return super().__new__(cls, name, bases, attrs)
 
 
-@six.add_metaclass(PolymorphicSerializerMetaclass)
-class PolymorphicSerializer(BaseSerializer):
+class PolymorphicSerializer(BaseSerializer, metaclass=PolymorphicSerializerMetaclass):
     """
     A `PolymorphicSerializer` is a special serializer that, itself, does not
     perform serialization or validation, but rather delegates those tasks to
@@ -74,28 +74,44 @@ class PolymorphicSerializer(BaseSerializer):
         assert not hasattr(meta, 'type_field') or self.type_field != 'type', \
             'Redundant type_field. Simply omit the type_field from meta.'
 
-        super(PolymorphicSerializer, self).__init__(*args, **kwargs)
+        # Delegate serializers, by serializer class. Building one means
+        # building all of its fields, so only do so once per type (as long as
+        # our instance and data have not changed, e.g. by saving).
+        self._serializer_cache = {}
+
+        super().__init__(*args, **kwargs)
 
     def get_serializer_class(self, instance=None, data=empty):
         """
         Returns the appropriate serializer to use for given data or instance.
         """
         if instance is not None:
-            for cls, (name, serializer) in self._declared_classes.items():
-                if cls == instance.__class__:
-                    return serializer
-        elif data is not empty:
             try:
-                type_value = get_attribute(data, [self.type_field])
+                return self._declared_classes[instance.__class__][1]
             except KeyError:
+                raise ValidationError('Bad type.')
+        elif data is not empty:
+            try:
+                type_value = data[self.type_field]
+            except (KeyError, TypeError):
                 raise ValidationError('No type specified.')
 
-            for name, (cls, serializer) in self._declared_types.items():
-                if name == type_value:
-                    return serializer
+            try:
+                return self._declared_types[type_value][1]
+            except (KeyError, TypeError):
+                raise ValidationError('Bad type.')
         return
 
     def get_serializer(self, instance=None, data=empty):
+        serializer_class = self.get_serializer_class(instance, data)
+
+        serializer = self._serializer_cache.get(serializer_class)
+        if serializer is not None and \
+                serializer.instance is self.instance and \
+                getattr(serializer, 'initial_data', empty) is \
+                getattr(self, 'initial_data', empty):
+            return serializer
+
         sargs = {
             'instance': self.instance,
             'partial': self.partial,
@@ -106,10 +122,13 @@ class PolymorphicSerializer(BaseSerializer):
             sargs['data'] = self.initial_data
 
         try:
-            return self.get_serializer_class(instance, data)(**sargs)
+            serializer = serializer_class(**sargs)
         except TypeError:
             raise ValidationError('Bad type.')
 
+        self._serializer_cache[serializer_class] = serializer
+        return serializer
+
     def run_validation(self, data=empty):
         # Make sure we maintain the type field!
         if data is empty:
@@ -125,7 +144,7 @@ class PolymorphicSerializer(BaseSerializer):
 
     def to_representation(self, instance):
         data = self.get_serializer(instance=instance).to_representation(instance)
-        data[self.type_field] = self._declared_classes[instance.__class__][0]
+        data[self.type_field] = self._type_name_for_class[instance.__class__]
         return data
 
     def create(self, validated_data):
@@ -69,7 +69,11 @@ setup(
     author_email='john.chadwick@marketfy.com',
     packages=get_packages('rest_toolbox'),
     package_data=get_package_data('rest_toolbox'),
+    python_requires='>=3.7',
     install_requires=[],
+    extras_require={
+        'fast': ['pybase64'],
+    },
     zip_safe=False,
     classifiers=[
         'Development Status :: 2 - Pre-Alpha',